@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""TVPlayer installer (Linux). install.sh is a thin wrapper around this."""
+import argparse
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import venv
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+GREEN = "\033[32m"
+RESET = "\033[0m"
+
+# Optional ffmpeg/GStreamer install per package manager: (tool, install command)
+_MEDIA_PACKAGES = (
+    ("apt-get", [
+        ["sudo", "apt-get", "update"],
+        ["sudo", "apt-get", "install", "-y", "ffmpeg",
+         "gstreamer1.0-plugins-base",
+         "gstreamer1.0-plugins-good",
+         "gstreamer1.0-plugins-bad",
+         "gstreamer1.0-plugins-ugly",
+         "gstreamer1.0-libav",
+         "gstreamer1.0-pulseaudio"],
+    ]),
+    ("pacman", [
+        ["sudo", "pacman", "-Sy", "--needed", "ffmpeg",
+         "gstreamer",
+         "gst-plugins-base",
+         "gst-plugins-good",
+         "gst-plugins-bad",
+         "gst-plugins-ugly",
+         "gst-libav"],
+    ]),
+    ("dnf", [
+        ["sudo", "dnf", "install", "-y", "ffmpeg",
+         "gstreamer1-plugins-base",
+         "gstreamer1-plugins-good",
+         "gstreamer1-plugins-bad-free",
+         "gstreamer1-plugins-ugly-free",
+         "gstreamer1-libav"],
+    ]),
+)
+
+
+def parse_venv_flags(flags: str) -> Dict[str, object]:
+    """Translate `python -m venv` style flags into venv.EnvBuilder options."""
+    parser = argparse.ArgumentParser(prog="VENV_FLAGS", add_help=False)
+    parser.add_argument("--system-site-packages", action="store_true")
+    parser.add_argument("--without-pip", action="store_true")
+    parser.add_argument("--copies", action="store_true")
+    parser.add_argument("--clear", action="store_true")
+    parser.add_argument("--upgrade-deps", action="store_true")
+    parser.add_argument("--prompt")
+    args = parser.parse_args(shlex.split(flags))
+    return {
+        "system_site_packages": args.system_site_packages,
+        "with_pip": not args.without_pip,
+        "symlinks": not args.copies and os.name != "nt",
+        "clear": args.clear,
+        "upgrade_deps": args.upgrade_deps,
+        "prompt": args.prompt,
+    }
+
+
+def _install_media_tools(ask: Callable[[str], str]) -> None:
+    """Offer to install ffmpeg and GStreamer plugins when ffprobe is missing."""
+    if shutil.which("ffprobe"):
+        return
+    print("ffmpeg/ffprobe not found. The program may use fallback durations.")
+    for tool, commands in _MEDIA_PACKAGES:
+        if shutil.which(tool):
+            ans = ask(f"Install ffmpeg and GStreamer plugins using {tool}? [y/N]: ")
+            if ans.strip().lower() == "y":
+                for cmd in commands:
+                    subprocess.run(cmd, check=True)
+            return
+
+
+def perform_install(home: Optional[Path] = None, cwd: Optional[Path] = None,
+                    skip_pip: bool = False, venv_options: Optional[Dict[str, object]] = None,
+                    ask: Callable[[str], str] = input) -> None:
+    """Create the venv, folder structure and desktop entry under cwd."""
+    home = Path(home if home is not None else Path.home())
+    cwd = Path(cwd if cwd is not None else Path.cwd()).resolve()
+    print("=== TVPlayer Installer (Linux) ===")
+
+    # Create virtual environment
+    venv_dir = cwd / ".venv"
+    if not venv_dir.is_dir():
+        options = {"with_pip": True, "symlinks": os.name != "nt"}
+        options.update(venv_options or {})
+        venv.EnvBuilder(**options).create(str(venv_dir))
+    venv_python = venv_dir / "bin" / "python"
+
+    # Install Python packages
+    if not skip_pip:
+        print("Installing Python packages...")
+        result = subprocess.run([str(venv_python), "-m", "pip", "install", "-r", "requirements.txt"], cwd=cwd)
+        pkg_ok = result.returncode == 0
+    else:
+        print("Skipping Python package installation")
+        pkg_ok = True
+
+    # Optional: install ffmpeg if missing
+    _install_media_tools(ask)
+
+    channels_dir = cwd / "Channels"
+    print(f"Creating folder structure under {channels_dir}")
+    for sub in ("Shows", "Commercials", "Bumpers"):
+        (channels_dir / "Channel1" / sub).mkdir(parents=True, exist_ok=True)
+    for name in ("schedules", "logs"):
+        (cwd / name).mkdir(exist_ok=True)
+    dir_ok = True
+
+    mpath = ask("Enter the path to your media folder to create Channel1 with no commercials (leave blank to skip): ").strip()
+    if mpath and os.path.isdir(mpath):
+        shows = channels_dir / "Channel1" / "Shows"
+        for entry in os.scandir(mpath):
+            target = shows / entry.name
+            if entry.is_file() and not target.exists():
+                try:
+                    shutil.copy2(entry.path, target)
+                except OSError:
+                    pass
+    copy_ok = True
+
+    desktop_dir = home / "Desktop"
+    desktop_dir.mkdir(parents=True, exist_ok=True)
+    desktop_file = desktop_dir / "TVPlayer.desktop"
+    desktop_file.write_text(
+        "[Desktop Entry]\n"
+        "Type=Application\n"
+        "Name=TVPlayer\n"
+        f"Exec={venv_python} \"{cwd / 'tv.py'}\"\n"
+        f"Path={cwd}\n"
+        f"Icon={cwd / 'logo.png'}\n"
+        "Terminal=false\n"
+    )
+    desktop_file.chmod(desktop_file.stat().st_mode | 0o111)
+
+    if pkg_ok:
+        print(f"{GREEN}[✓] Python packages installed{RESET}")
+    if dir_ok:
+        print(f"{GREEN}[✓] Folder structure created{RESET}")
+    if copy_ok:
+        print(f"{GREEN}[✓] Media setup complete{RESET}")
+    print(f"{GREEN}[✓] Installation complete. Run with: {venv_python} 'tv.py'{RESET}")
+    print("If you have a logo.png file in this directory it will be used for the")
+    print("system tray icon on supported desktops.")
+
+
+def main() -> int:
+    perform_install(
+        skip_pip=bool(os.environ.get("SKIP_PIP")),
+        venv_options=parse_venv_flags(os.environ.get("VENV_FLAGS", "")),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,102 +1,12 @@
 #!/bin/bash
+# Thin wrapper around install.py; run from the directory to install into.
+# SKIP_PIP=1 skips the package install, VENV_FLAGS passes options to venv.
 set -e
 
-GREEN="\e[32m"
-RESET="\e[0m"
-echo "=== TVPlayer Installer (Linux) ==="
-
 # Ensure Python 3 is available
 if ! command -v python3 >/dev/null; then
     echo "Python 3 is required. Please install Python 3 and re-run this script."
     exit 1
 fi
 
-# Create virtual environment
-if [ ! -d ".venv" ]; then
-    python3 -m venv .venv
-fi
-source .venv/bin/activate
-
-# Install Python packages
-if [ -z "$SKIP_PIP" ]; then
-    echo "Installing Python packages..."
-    if pip install -r requirements.txt; then
-        pkg_ok=true
-    else
-        pkg_ok=false
-    fi
-else
-    echo "Skipping Python package installation"
-    pkg_ok=true
-fi
-
-# Optional: install ffmpeg if missing
-if ! command -v ffprobe >/dev/null; then
-    echo "ffmpeg/ffprobe not found. The program may use fallback durations."
-    if command -v apt-get >/dev/null; then
-        read -p "Install ffmpeg and GStreamer plugins using apt-get? [y/N]: " ans
-        if [[ "$ans" =~ ^[Yy]$ ]]; then
-            sudo apt-get update
-            sudo apt-get install -y ffmpeg \
-                gstreamer1.0-plugins-base \
-                gstreamer1.0-plugins-good \
-                gstreamer1.0-plugins-bad \
-                gstreamer1.0-plugins-ugly \
-                gstreamer1.0-libav \
-                gstreamer1.0-pulseaudio
-        fi
-    elif command -v pacman >/dev/null; then
-        read -p "Install ffmpeg and GStreamer plugins using pacman? [y/N]: " ans
-        if [[ "$ans" =~ ^[Yy]$ ]]; then
-            sudo pacman -Sy --needed ffmpeg \
-                gstreamer \
-                gst-plugins-base \
-                gst-plugins-good \
-                gst-plugins-bad \
-                gst-plugins-ugly \
-                gst-libav
-        fi
-    elif command -v dnf >/dev/null; then
-        read -p "Install ffmpeg and GStreamer plugins using dnf? [y/N]: " ans
-        if [[ "$ans" =~ ^[Yy]$ ]]; then
-            sudo dnf install -y ffmpeg \
-                gstreamer1-plugins-base \
-                gstreamer1-plugins-good \
-                gstreamer1-plugins-bad-free \
-                gstreamer1-plugins-ugly-free \
-                gstreamer1-libav
-        fi
-    fi
-fi
-
-CHANNELS_DIR="$(pwd)/Channels"
-echo "Creating folder structure under $CHANNELS_DIR"
-mkdir -p "$CHANNELS_DIR/Channel1/Shows" "$CHANNELS_DIR/Channel1/Commercials" "$CHANNELS_DIR/Channel1/Bumpers"
-mkdir -p "schedules" "logs"
-dir_ok=true
-
-read -p "Enter the path to your media folder to create Channel1 with no commercials (leave blank to skip): " mpath
-if [ -n "$mpath" ] && [ -d "$mpath" ]; then
-    cp -n "$mpath"/* "$CHANNELS_DIR/Channel1/Shows" 2>/dev/null || true
-fi
-copy_ok=true
-
-DESKTOP_DIR="${HOME}/Desktop"
-mkdir -p "$DESKTOP_DIR"
-cat > "$DESKTOP_DIR/TVPlayer.desktop" <<EOF
-[Desktop Entry]
-Type=Application
-Name=TVPlayer
-Exec=$(pwd)/.venv/bin/python "$(pwd)/tv.py"
-Path=$(pwd)
-Icon=$(pwd)/logo.png
-Terminal=false
-EOF
-chmod +x "$DESKTOP_DIR/TVPlayer.desktop"
-
-if [ "$pkg_ok" = true ]; then echo -e "${GREEN}[✓] Python packages installed${RESET}"; fi
-if [ "$dir_ok" = true ]; then echo -e "${GREEN}[✓] Folder structure created${RESET}"; fi
-if [ "$copy_ok" = true ]; then echo -e "${GREEN}[✓] Media setup complete${RESET}"; fi
-echo -e "${GREEN}[✓] Installation complete. Run with: $(pwd)/.venv/bin/python 'tv.py'${RESET}"
-echo "If you have a logo.png file in this directory it will be used for the"
-echo "system tray icon on supported desktops."
+exec python3 "$(dirname "$0")/install.py"
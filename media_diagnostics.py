@@ -7,20 +7,33 @@ APP_ROOT = Path(__file__).resolve().parent
 LOG_DIR = APP_ROOT / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
+_md_logger = logging.getLogger("qtmultimedia")
+if not _md_logger.handlers:
+    _handler = logging.FileHandler(LOG_DIR / "qtmultimedia.log")
+    _handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    _md_logger.addHandler(_handler)
+    _md_logger.setLevel(logging.INFO)
+
+_SUPPORTED_MIME_CACHE = None
+
+
+def _get_supported_mimes() -> tuple:
+    """Query the backend's MIME types once; later callers reuse the result."""
+    global _SUPPORTED_MIME_CACHE
+    if _SUPPORTED_MIME_CACHE is None:
+        _SUPPORTED_MIME_CACHE = tuple(QMediaPlayer().supportedMimeTypes())
+        _md_logger.info("Supported MIME types: %s", ", ".join(_SUPPORTED_MIME_CACHE))
+        if "video/mp4" not in _SUPPORTED_MIME_CACHE and "video/h264" not in _SUPPORTED_MIME_CACHE:
+            _md_logger.warning("Missing 'video/mp4' or 'video/h264' support")
+    return _SUPPORTED_MIME_CACHE
+
+
 class MediaDiagnostics:
     """Mixin providing verbose QMediaPlayer diagnostics."""
     def __init__(self) -> None:
-        self._md_logger = logging.getLogger("qtmultimedia")
-        if not self._md_logger.handlers:
-            handler = logging.FileHandler(LOG_DIR / "qtmultimedia.log")
-            handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-            self._md_logger.addHandler(handler)
-            self._md_logger.setLevel(logging.INFO)
+        self._md_logger = _md_logger
         try:
-            types = QMediaPlayer().supportedMimeTypes()
-            self._md_logger.info("Supported MIME types: %s", ", ".join(types))
-            if "video/mp4" not in types and "video/h264" not in types:
-                self._md_logger.warning("Missing 'video/mp4' or 'video/h264' support")
+            _get_supported_mimes()
         except Exception as e:  # pragma: no cover - diagnostics only
             self._md_logger.error(f"supportedMimeTypes preflight failed: {e}")
 
@@ -0,0 +1,50 @@
+"""Pure helpers behind the player's subtitle lookup and duration cache journal."""
+import bisect
+import itertools
+import json
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+Cue = Tuple[int, int, str]
+
+
+def subtitle_max_ends(cues: Sequence[Cue]) -> List[int]:
+    """Running max of cue end times for cues sorted by start."""
+    return list(itertools.accumulate((cue[1] for cue in cues), max))
+
+
+def subtitle_index(cues: Sequence[Cue], starts: Sequence[int], max_ends: Sequence[int],
+                   cursor: int, position: int) -> int:
+    """Return the index of the earliest cue showing at position, or -1 if none.
+
+    cues are sorted by start; starts and max_ends are the matching start
+    times and subtitle_max_ends(cues). cursor is the last index returned and
+    makes steady playback O(1). Overlapping cues keep the earlier one on
+    screen until it ends, like a front-to-back scan.
+    """
+    if (cursor < len(cues) and cues[cursor][0] <= position <= cues[cursor][1]
+            and (cursor == 0 or max_ends[cursor - 1] < position)):
+        return cursor
+    found = -1
+    # Walk back from the last cue started while an earlier one could still be running
+    idx = bisect.bisect_right(starts, position) - 1
+    while idx >= 0 and max_ends[idx] >= position:
+        if cues[idx][1] >= position:
+            found = idx
+        idx -= 1
+    return found
+
+
+def journal_line(key: str, duration: int) -> str:
+    """Format one duration cache journal entry."""
+    return json.dumps([key, duration]) + "\n"
+
+
+def replay_journal(lines: Iterable[str], durations: Dict[str, int]) -> Dict[str, int]:
+    """Apply journal entries on top of durations, skipping unreadable lines."""
+    for line in lines:
+        try:
+            key, duration = json.loads(line)
+            durations[key] = int(duration)
+        except Exception:
+            continue  # torn last line after a crash
+    return durations
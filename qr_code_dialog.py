@@ -5,9 +5,27 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QFileDialog,
 )
-from PyQt5.QtGui import QPixmap
-import qrcode
-from io import BytesIO
+from PyQt5.QtGui import QImage, QPixmap
+
+_QR_CSS_TEMPLATE = (
+    "QDialog {background:{bg};color:{fg};}"
+    "QLabel {color:{fg};}"
+    "QPushButton {background:{alt};color:{fg};border:2px solid {fg};"
+    "padding:6px 12px;font-weight:bold;}"
+    "QPushButton:hover {background:{hover};}"
+)
+
+
+def _qr_pixmap(data) -> QPixmap:
+    """Render *data* as a QR code pixmap."""
+    from qr_utils import make_qr_image  # deferred: pulls in qrcode
+
+    # Hand the 8-bit pixels straight to Qt instead of a PNG encode/decode.
+    # (PIL.ImageQt dropped PyQt5 support in Pillow 10, so it isn't used.)
+    img = make_qr_image(data).convert("L")
+    width, height = img.size
+    qimg = QImage(img.tobytes(), width, height, width, QImage.Format_Grayscale8)
+    return QPixmap.fromImage(qimg.copy())
 
 
 class QRCodeDialog(QDialog):
@@ -17,18 +35,8 @@ class QRCodeDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("[WEB] Remote QR")
         if parent and hasattr(parent, "css"):
-            self.setStyleSheet(parent.css(
-                "QDialog {background:{bg};color:{fg};}"
-                "QLabel {color:{fg};}"
-                "QPushButton {background:{alt};color:{fg};border:2px solid {fg};"
-                "padding:6px 12px;font-weight:bold;}"
-                "QPushButton:hover {background:{hover};}"
-            ))
-        buf = BytesIO()
-        qrcode.make(data).save(buf, format="PNG")
-        buf.seek(0)
-        pix = QPixmap()
-        pix.loadFromData(buf.read(), "PNG")
+            self.setStyleSheet(parent.css(_QR_CSS_TEMPLATE))
+        pix = _qr_pixmap(data)
 
         v = QVBoxLayout(self)
         v.addWidget(QLabel(f"<b>{data}</b>"))
@@ -41,6 +49,11 @@ class QRCodeDialog(QDialog):
         v.addWidget(save)
 
     def _save_png(self, pix):
-        path, _ = QFileDialog.getSaveFileName(self, "Save QR", "", "PNG (*.png)")
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Save QR", "", "PNG (*.png)",
+            options=QFileDialog.DontUseCustomDirectoryIcons,
+        )
         if path:
-            pix.save(path, "PNG")
+            # QR art is flat black/white, so heavier zlib levels buy almost
+            # nothing; Qt maps quality 80 to zlib level 1
+            pix.save(path, "PNG", 80)
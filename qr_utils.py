@@ -1,17 +1,81 @@
+import struct
+import zlib
 from pathlib import Path
-import qrcode
+from typing import Optional
 
 APP_ROOT = Path(__file__).resolve().parent
 TMP_DIR = APP_ROOT / "tmp"
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Byte-mode capacity of QR versions 1-40 at error-correction level M
+# (qrcode's default), from the ISO/IEC 18004 capacity table.
+_BYTE_CAPACITY_M = (
+    14, 26, 42, 62, 84, 106, 122, 152, 180, 213,
+    251, 287, 331, 362, 412, 450, 504, 560, 624, 666,
+    711, 779, 857, 911, 997, 1059, 1125, 1190, 1264, 1370,
+    1452, 1538, 1628, 1722, 1809, 1911, 1989, 2099, 2213, 2331,
+)
+
+
+def min_qr_version(data) -> Optional[int]:
+    """Return the smallest QR version that holds *data* in byte mode."""
+    size = len(data if isinstance(data, bytes) else str(data).encode("utf-8"))
+    return next((v for v, cap in enumerate(_BYTE_CAPACITY_M, 1) if size <= cap), None)
+
+
+def _build_qr(data):
+    """Return a compiled QRCode for *data* with the version picked up front."""
+    # Deferred so importing qr_utils (and the app) doesn't load qrcode
+    import qrcode
+    from qrcode.util import MODE_8BIT_BYTE
+
+    qr = qrcode.QRCode()
+    qr.add_data(data)
+    # The table only holds for byte mode; numeric/alphanumeric chunks pack
+    # denser, so leave those to qrcode's own best-fit search.
+    version = min_qr_version(data)
+    if version is not None and all(chunk.mode == MODE_8BIT_BYTE for chunk in qr.data_list):
+        qr.version = version
+    qr.make(fit=False)
+    return qr
+
+
+def make_qr_image(data):
+    """Build the QR code image (Pillow) for *data*."""
+    return _build_qr(data).make_image()
+
+
+def _png_chunk(kind: bytes, payload: bytes) -> bytes:
+    """Frame *payload* as a PNG chunk with its length and CRC."""
+    body = kind + payload
+    return struct.pack(">I", len(payload)) + body + struct.pack(">I", zlib.crc32(body))
+
+
+def _qr_png_bytes(matrix, box_size: int) -> bytes:
+    """Encode a module matrix (border included) as a 1-bit grayscale PNG."""
+    size = len(matrix) * box_size
+    pad = -size % 8
+    rows = []
+    for row in matrix:
+        # dark modules are 0 (black), light modules 1 (white)
+        bits = "".join(("0" if dark else "1") * box_size for dark in row) + "0" * pad
+        line = b"\x00" + int(bits, 2).to_bytes(len(bits) // 8, "big")
+        rows.append(line * box_size)
+    ihdr = struct.pack(">IIBBBBB", size, size, 1, 0, 0, 0, 0)
+    return (_PNG_SIGNATURE
+            + _png_chunk(b"IHDR", ihdr)
+            + _png_chunk(b"IDAT", zlib.compress(b"".join(rows), 1))
+            + _png_chunk(b"IEND", b""))
+
 
 def make_qr_png(text: str, out_path: Path) -> None:
     """Generate a QR code PNG containing *text* and save to *out_path*.
 
-    The parent directory of *out_path* is created automatically. By
-    convention, place outputs inside :data:`TMP_DIR`.
+    The PNG is written directly from the module matrix, without going
+    through Pillow. The parent directory of *out_path* is created
+    automatically. By convention, place outputs inside :data:`TMP_DIR`.
     """
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    img = qrcode.make(text)  # uses Pillow under the hood
-    img.save(str(out_path))
-
+    qr = _build_qr(text)
+    out_path.write_bytes(_qr_png_bytes(qr.get_matrix(), qr.box_size))
@@ -0,0 +1,4 @@
+"""Filesystem locations shared by the test modules."""
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
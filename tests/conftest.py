@@ -0,0 +1,56 @@
+import hashlib
+import sys
+from pathlib import Path
+
+import pytest
+
+from _paths import ROOT
+
+# Make the app modules at the repo root importable from the tests
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="session")
+def installed_tree(tmp_path_factory):
+    """Run the installer once in a scratch tree; return (work, home)."""
+    import install
+
+    base = tmp_path_factory.mktemp("install")
+    work = base / 'work'
+    work.mkdir()
+    home = base / 'home'
+    (home / 'Desktop').mkdir(parents=True)
+
+    # No pip inside the test venv; nothing in it is ever run. Blank answers
+    # to the prompts.
+    install.perform_install(
+        home=home, cwd=work, skip_pip=True,
+        venv_options=install.parse_venv_flags('--without-pip --system-site-packages'),
+        ask=lambda prompt: '',
+    )
+    return work, home
+
+
+@pytest.fixture(scope="session")
+def ps1_bytes():
+    """Raw contents of install.ps1, read once per session."""
+    return (ROOT / 'install.ps1').read_bytes()
+
+
+@pytest.fixture(scope="session")
+def qr_png(tmp_path_factory):
+    """Return a function mapping a payload to its QR PNG, encoded once per session."""
+    from qr_utils import make_qr_png
+
+    cache_dir = tmp_path_factory.mktemp("qr_cache")
+    made = {}
+
+    def get(payload: str) -> Path:
+        if payload not in made:
+            out = cache_dir / f"{hashlib.sha1(payload.encode('utf-8')).hexdigest()}.png"
+            make_qr_png(payload, out)
+            made[payload] = out
+        return made[payload]
+
+    return get
@@ -1,7 +1,15 @@
-import subprocess, sys
+import py_compile
 
-FILES = ['tv.py', 'qr_code_dialog.py', 'qr_utils.py']
+import pytest
 
-def test_python_files_compile():
-    for f in FILES:
-        subprocess.check_call([sys.executable, '-m', 'py_compile', f])
+from _paths import ROOT
+
+FILES = ['tv.py', 'qr_code_dialog.py', 'qr_utils.py', 'install.py', 'playback_utils.py']
+
+@pytest.mark.parametrize('f', FILES)
+def test_python_files_compile(f, tmp_path):
+    # Write the bytecode into tmp_path so parallel workers don't race on __pycache__
+    try:
+        py_compile.compile(str(ROOT / f), cfile=str(tmp_path / (f + 'c')), doraise=True)
+    except py_compile.PyCompileError as e:
+        pytest.fail(str(e))
@@ -1,36 +1,32 @@
 import os
+import re
 import subprocess
-import sys
-import shutil
-from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
+from _paths import ROOT
 
+# Both install.ps1 markers, matched in a single scan
+PS1_NEEDLES = re.compile(rb'python -m venv|CreateShortcut')
 
-def test_install_sh_creates_venv_and_desktop(tmp_path):
-    # copy required files to temp working directory
-    work = tmp_path / 'work'
-    work.mkdir()
-    for fname in ['install.sh', 'requirements.txt', 'tv.py']:
-        shutil.copy(ROOT / fname, work / fname)
 
-    home = tmp_path / 'home'
-    desktop = home / 'Desktop'
-    desktop.mkdir(parents=True)
-
-    env = os.environ.copy()
-    env['HOME'] = str(home)
-    env['SKIP_PIP'] = '1'
+def test_perform_install_creates_venv_and_desktop(installed_tree):
+    work, home = installed_tree
+    assert (work / '.venv').exists()
+    assert (work / 'Channels').exists()
+    assert (home / 'Desktop' / 'TVPlayer.desktop').exists()
 
-    # run installer with blank answers to prompts
-    subprocess.run(['bash', 'install.sh'], cwd=work, env=env, input='\n\n', text=True, check=True)
 
-    assert (work / 'venv').exists()
-    assert (work / 'Channels').exists()
-    assert (desktop / 'TVPlayer.desktop').exists()
+def test_install_sh_hands_off_to_install_py(tmp_path):
+    # The wrapper runs install.py against its working directory and passes
+    # SKIP_PIP / VENV_FLAGS through the environment
+    home = tmp_path / 'home'
+    env = {**os.environ, 'HOME': str(home), 'SKIP_PIP': '1', 'VENV_FLAGS': '--without-pip'}
+    subprocess.run(['bash', str(ROOT / 'install.sh')], cwd=tmp_path, env=env,
+                   input='\n\n', text=True, capture_output=True, check=True)
+    assert (tmp_path / '.venv' / 'bin' / 'python').exists()
+    assert not (tmp_path / '.venv' / 'bin' / 'pip').exists()
+    assert (home / 'Desktop' / 'TVPlayer.desktop').exists()
 
 
-def test_install_ps1_contains_venv_and_shortcut():
-    content = (ROOT / 'install.ps1').read_text()
-    assert 'python -m venv' in content
-    assert 'CreateShortcut' in content
+def test_install_ps1_contains_venv_and_shortcut(ps1_bytes):
+    hits = {m.group() for m in PS1_NEEDLES.finditer(ps1_bytes)}
+    assert {b'python -m venv', b'CreateShortcut'} <= hits
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from playback_utils import journal_line, replay_journal, subtitle_index, subtitle_max_ends
+
+
+def _linear_index(cues, position):
+    for i, (start, end, _text) in enumerate(cues):
+        if start <= position <= end:
+            return i
+    return -1
+
+
+def _random_cues(rng):
+    cues = []
+    for _ in range(rng.randint(0, 40)):
+        start = rng.randint(0, 5000)
+        cues.append((start, start + rng.randint(0, 800), "x"))
+    cues.sort(key=lambda cue: cue[0])
+    return cues
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_subtitle_index_matches_linear_scan(seed):
+    rng = random.Random(seed)
+    cues = _random_cues(rng)
+    starts = [cue[0] for cue in cues]
+    max_ends = subtitle_max_ends(cues)
+    # Steady playback followed by random seeks, threading the cursor through
+    positions = list(range(-10, 6000, 7)) + [rng.randint(-10, 6000) for _ in range(300)]
+    cursor = 0
+    for position in positions:
+        idx = subtitle_index(cues, starts, max_ends, cursor, position)
+        assert idx == _linear_index(cues, position), (seed, position, cursor)
+        if idx >= 0:
+            cursor = idx
+
+
+def test_replay_journal_skips_torn_last_line():
+    lines = [journal_line("a.mp4", 1000), "not json\n",
+             journal_line("b.mp4", 2000), journal_line("a.mp4", 1500)]
+    lines.append(journal_line("c.mp4", 3000)[:7])
+    durations = replay_journal(lines, {"z.mp4": 1})
+    assert durations == {"z.mp4": 1, "a.mp4": 1500, "b.mp4": 2000}
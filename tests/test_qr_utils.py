@@ -1,18 +1,24 @@
-import sys
-from pathlib import Path
+import struct
 
-# Add parent directory to path if needed
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import pytest
 
-from qr_utils import TMP_DIR, make_qr_png
+from qr_utils import min_qr_version
 
 
-def test_make_qr_png_creates_file():
-    out = TMP_DIR / "test_qr.png"
-    if out.exists():
-        out.unlink()
-    make_qr_png("hello", out)
+@pytest.mark.parametrize("payload", ["hello", "", "x" * 100])
+def test_make_qr_png_creates_file(payload, qr_png):
+    out = qr_png(payload)
     assert out.exists()
-    out.unlink()
+    data = out.read_bytes()
+    assert data.startswith(b"\x89PNG\r\n\x1a\n")
+    # IHDR: square image, 10px per module, at least version 1 + 4-module border
+    width, height = struct.unpack(">II", data[16:24])
+    assert width == height
+    assert width % 10 == 0 and width >= (21 + 8) * 10
+
+
+def test_min_qr_version_matches_byte_capacity():
+    assert min_qr_version("x" * 14) == 1
+    assert min_qr_version("x" * 15) == 2
+    assert min_qr_version("é" * 8) == 2  # UTF-8 bytes, not characters
+    assert min_qr_version("x" * 2332) is None